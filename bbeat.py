@@ -4,14 +4,16 @@
 # CLEAN: Pure binaural tones only — no noise, no distractions
 
 import sys
+import threading
 import numpy as np
 import sounddevice as sd
+from numba import njit
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QLabel,
     QDial, QPushButton, QGroupBox, QGridLayout)
-from PyQt6.QtCore import Qt, QTimer, QRectF
+from PyQt6.QtCore import Qt, QTimer, QRectF, QPointF
 from PyQt6.QtGui import (
-    QColor, QPainter, QPainterPath, QPen, QFont, QFontDatabase, QBrush
+    QColor, QPainter, QPixmap, QPolygonF, QPen, QFont, QFontDatabase, QBrush
 )
 import math
 
@@ -34,6 +36,10 @@ def find_monospace_family():
 class GlowDial(QDial):
     """Analog mixer-style knob – clean, flat, no glow."""
 
+    # Knob position (270° sweep, starts at 135°)
+    SPAN_ANGLE = 270
+    START_ANGLE = 135
+
     def __init__(self, parent=None, line_color="#4CAF50", knob_color="#1E1E1E",
                  text_color="#C7F464", accent_color="#7AFF37"):
         super().__init__(parent)
@@ -46,30 +52,48 @@ class GlowDial(QDial):
         self.setMinimumSize(70, 70)
         self.setWrapping(False)
         self.setFocusPolicy(Qt.FocusPolicy.StrongFocus)
-
-    def paintEvent(self, event):
-        painter = QPainter(self)
+        self._bg_pixmap = None
+        self._tick_lines = []
+
+    def _geometry(self):
+        size = min(self.width(), self.height())
+        center = self.rect().center()
+        outer_radius = size / 2 - 4
+        knob_radius = outer_radius * 0.65
+
+        rect = QRectF(center.x() - outer_radius, center.y() - outer_radius,
+                     outer_radius * 2, outer_radius * 2)
+        knob_rect = QRectF(center.x() - knob_radius, center.y() - knob_radius,
+                          knob_radius * 2, knob_radius * 2)
+        return center, rect, knob_rect, knob_radius
+
+    def resizeEvent(self, event):
+        self._bg_pixmap = None
+        center, rect, _, _ = self._geometry()
+        tick_rect = rect.adjusted(8, 8, -8, -8)
+        self._tick_lines = []
+        for i in range(5):
+            tick_angle = self.START_ANGLE + (i * self.SPAN_ANGLE / 4) - 90
+            rad = math.radians(tick_angle)
+            x1 = center.x() + tick_rect.width() / 2 * math.cos(rad)
+            y1 = center.y() + tick_rect.height() / 2 * math.sin(rad)
+            x2 = center.x() + (tick_rect.width() / 2 - 8) * math.cos(rad)
+            y2 = center.y() + (tick_rect.height() / 2 - 8) * math.sin(rad)
+            self._tick_lines.append((int(x1), int(y1), int(x2), int(y2)))
+        super().resizeEvent(event)
+
+    def _render_background(self):
+        """Ring, tick marks and knob body – everything that ignores value()."""
+        dpr = self.devicePixelRatioF()
+        pixmap = QPixmap(round(self.width() * dpr), round(self.height() * dpr))
+        pixmap.setDevicePixelRatio(dpr)
+        pixmap.fill(Qt.GlobalColor.transparent)
+
+        _, rect, knob_rect, _ = self._geometry()
+        painter = QPainter(pixmap)
         try:
             painter.setRenderHint(QPainter.RenderHint.Antialiasing)
 
-            size = min(self.width(), self.height())
-            center = self.rect().center()
-            outer_radius = size / 2 - 4
-            knob_radius = outer_radius * 0.65
-
-            rect = QRectF(center.x() - outer_radius, center.y() - outer_radius,
-                         outer_radius * 2, outer_radius * 2)
-            knob_rect = QRectF(center.x() - knob_radius, center.y() - knob_radius,
-                              knob_radius * 2, knob_radius * 2)
-
-            # Knob position (270° sweep, starts at 135°)
-            span_angle = 270
-            start_angle = 135
-            angle_range = self.maximum() - self.minimum()
-            angle = 0
-            if angle_range > 0:
-                angle = (self.value() - self.minimum()) / angle_range * span_angle
-
             # === 1. BACKGROUND RING — FLAT ===
             painter.setBrush(QBrush(QColor("#1A1A1A")))
             painter.setPen(QPen(QColor("#3A3A3A"), 1))
@@ -78,37 +102,51 @@ class GlowDial(QDial):
             painter.setPen(QPen(QColor("#C7F464"), 1.5))
             painter.drawEllipse(rect.adjusted(-1, -1, 1, 1))
 
-            # === 2. SWEEP LINE — THIN, NO GLOW ===
+            # === 2. TICK MARKS ===
+            painter.setPen(QPen(self.accent_color, 2))
+            for x1, y1, x2, y2 in self._tick_lines:
+                painter.drawLine(x1, y1, x2, y2)
+
+            # === 3. MAIN KNOB — FLAT ===
+            painter.setBrush(QBrush(QColor("#2A2A2A")))
+            painter.setPen(QPen(QColor("#3A3A3A"), 1))
+            painter.drawEllipse(knob_rect)
+
+            painter.setPen(QPen(QColor("#C7F464"), 1.5))
+            painter.drawArc(knob_rect.adjusted(1, 1, -2, -2), 0, 360 * 16)
+
+        finally:
+            painter.end()
+        return pixmap
+
+    def paintEvent(self, event):
+        # The static parts are cached; rebuild after a resize or screen change
+        dpr = self.devicePixelRatioF()
+        if self._bg_pixmap is None or self._bg_pixmap.devicePixelRatio() != dpr:
+            self._bg_pixmap = self._render_background()
+
+        painter = QPainter(self)
+        try:
+            painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+            painter.drawPixmap(0, 0, self._bg_pixmap)
+
+            center, rect, _, knob_radius = self._geometry()
+            angle_range = self.maximum() - self.minimum()
+            angle = 0
+            if angle_range > 0:
+                angle = (self.value() - self.minimum()) / angle_range * self.SPAN_ANGLE
+
+            # === 4. SWEEP LINE — THIN, NO GLOW ===
             arc_rect = rect.adjusted(6, 6, -6, -6)
             line_pen = QPen(self.line_color, 3)
             line_pen.setCapStyle(Qt.PenCapStyle.RoundCap)
             painter.setPen(line_pen)
             painter.setBrush(Qt.BrushStyle.NoBrush)
 
-            start_arc = int((90 - (start_angle + angle)) * 16)
+            start_arc = int((90 - (self.START_ANGLE + angle)) * 16)
             span_arc = int(angle * 16)
             painter.drawArc(arc_rect, start_arc, span_arc)
 
-            # === 3. TICK MARKS ===
-            painter.setPen(QPen(self.accent_color, 2))
-            tick_rect = rect.adjusted(8, 8, -8, -8)
-            for i in range(5):
-                tick_angle = start_angle + (i * span_angle / 4) - 90
-                rad = math.radians(tick_angle)
-                x1 = center.x() + tick_rect.width() / 2 * math.cos(rad)
-                y1 = center.y() + tick_rect.height() / 2 * math.sin(rad)
-                x2 = center.x() + (tick_rect.width() / 2 - 8) * math.cos(rad)
-                y2 = center.y() + (tick_rect.height() / 2 - 8) * math.sin(rad)
-                painter.drawLine(int(x1), int(y1), int(x2), int(y2))
-
-            # === 4. MAIN KNOB — FLAT ===
-            painter.setBrush(QBrush(QColor("#2A2A2A")))
-            painter.setPen(QPen(QColor("#3A3A3A"), 1))
-            painter.drawEllipse(knob_rect)
-
-            painter.setPen(QPen(QColor("#C7F464"), 1.5))
-            painter.drawArc(knob_rect.adjusted(1, 1, -2, -2), 0, 360 * 16)
-
             # === 5. INDICATOR LINE ===
             painter.setPen(QPen(QColor("#C7F464"), 4))
             painter.setBrush(Qt.BrushStyle.NoBrush)
@@ -116,7 +154,7 @@ class GlowDial(QDial):
 
             painter.save()
             painter.translate(center)
-            painter.rotate(start_angle + angle)
+            painter.rotate(self.START_ANGLE + angle)
             painter.drawLine(0, 0, 0, -indicator_length)
             painter.restore()
 
@@ -158,19 +196,51 @@ class Oscilloscope(QWidget):
         self.grid_color = QColor(40, 40, 40)
         self.wave_color = QColor(122, 255, 55)
         self.bg_color = QColor(20, 20, 20)
+        self._dirty = False
+        self._layout_trace()
+
+    def _layout_trace(self):
+        # The trace is drawn as a min/max envelope with at most one bin per
+        # pixel (and never more than 512); bin x positions only depend on the
+        # width and buffer length, so they are cached here.
+        L = max(len(self.buffer), 1)
+        bins = max(1, min(self.width(), 512, L))
+        self._step = -(-L // bins)
+        bins = L // self._step
+        xs = np.arange(bins, dtype=np.float64) * (self._step * self.width() / L)
+        # One polygon per envelope edge, reused every frame.  Their point
+        # storage (x0, y0, x1, y1, ... as doubles) is viewed as a (bins, 2)
+        # array, so a repaint only writes the y column – no QPointF objects.
+        self._polys = []
+        self._poly_points = []
+        for _ in range(2):
+            poly = QPolygonF()
+            poly.fill(QPointF(), bins)
+            data = poly.data()
+            data.setsize(bins * 2 * 8)
+            points = np.frombuffer(data, dtype=np.float64).reshape(bins, 2)
+            points[:, 0] = xs
+            self._polys.append(poly)
+            self._poly_points.append(points)
+
+    def resizeEvent(self, event):
+        self._layout_trace()
+        super().resizeEvent(event)
 
     def update_buffer(self, new_buffer: np.ndarray):
         if new_buffer is None:
             return
-        n = len(self.buffer)
-        if len(new_buffer) != n:
-            new = np.interp(np.linspace(0, 1, n), np.linspace(0, 1, len(new_buffer)), new_buffer)
+        if len(new_buffer) == len(self.buffer):
+            np.copyto(self.buffer, new_buffer)
         else:
-            new = new_buffer
-        self.buffer = new.astype(np.float32)
-        self.update()
+            self.buffer = np.array(new_buffer, dtype=np.float32)
+            self._layout_trace()
+        if not self._dirty:
+            self._dirty = True
+            self.update()
 
     def paintEvent(self, _event):
+        self._dirty = False
         painter = QPainter(self)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing, True)
         painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform, True)
@@ -196,19 +266,61 @@ class Oscilloscope(QWidget):
         if buf is None or len(buf) == 0:
             return
 
-        path = QPainterPath()
-        L = len(buf)
-        first = True
-        for i, v in enumerate(buf):
-            x = i / L * w
-            y = (1 - (v + 1) / 2.0) * h
-            if first:
-                path.moveTo(x, y)
-                first = False
-            else:
-                path.lineTo(x, y)
-
-        painter.drawPath(path)
+        bins = len(self._poly_points[0])
+        env = buf[:bins * self._step].reshape(bins, self._step)
+        for edge, poly, points in zip((env.min(axis=1), env.max(axis=1)),
+                                      self._polys, self._poly_points):
+            ys = points[:, 1]
+            np.multiply(edge, -0.5 * h, out=ys)
+            ys += 0.5 * h
+            painter.drawPolyline(poly)
+
+
+# === AUDIO KERNEL: ONE PASS PER CHUNK, COMPILED ===
+@njit(cache=True, fastmath=True, boundscheck=False, nogil=True)
+def _render(out, scope, table, ph_l, ph_r, dph_l, dph_r,
+            gain, ramp, ramp_dir, ramp_pos):
+    """Fill ``out`` (frames x 2) with the rotated tables, gain and ramp applied.
+
+    ``scope`` receives the mono mixdown of the same samples in the same pass.
+    ``table`` rows are cos/sin(w*k) for the left channel, then the right;
+    ``ramp`` is the 0 -> 1 envelope, read backwards when ramping out.
+
+    Returns the advanced ``(ph_l, ph_r, ramp_pos)``.
+    """
+    # Phases accumulate in float64; the per-sample math is kept in float32
+    # (the table/output dtype) so it runs at full SIMD width without upcasts.
+    cos_l, sin_l, cos_r, sin_r = table[0], table[1], table[2], table[3]
+    s_l = np.float32(math.sin(ph_l))
+    c_l = np.float32(math.cos(ph_l))
+    s_r = np.float32(math.sin(ph_r))
+    c_r = np.float32(math.cos(ph_r))
+    gain = np.float32(gain)
+    silence = np.float32(0.0)
+    half = np.float32(0.5)
+    ramp_samples = ramp.shape[0]
+    for i in range(out.shape[0]):
+        g = gain
+        if ramp_pos < ramp_samples:
+            if ramp_dir == 1:                     # ramp-in
+                g *= ramp[ramp_pos]
+            else:                                 # ramp-out
+                g *= ramp[ramp_samples - 1 - ramp_pos]
+            ramp_pos += 1
+        elif ramp_dir != 1:                       # faded out: hold silence
+            g = silence
+        left = g * (sin_l[i] * c_l + cos_l[i] * s_l)
+        right = g * (sin_r[i] * c_r + cos_r[i] * s_r)
+        out[i, 0] = left
+        out[i, 1] = right
+        scope[i] = half * (left + right)
+    # Increments are pre-wrapped to [0, 2*pi), so one subtraction suffices
+    two_pi = 2.0 * math.pi
+    ph_l += dph_l
+    ph_r += dph_r
+    ph_l -= two_pi * (ph_l >= two_pi)
+    ph_r -= two_pi * (ph_r >= two_pi)
+    return ph_l, ph_r, ramp_pos
 
 
 class BinauralGenerator(QMainWindow):
@@ -242,12 +354,48 @@ class BinauralGenerator(QMainWindow):
         self.master_gain = 0.3
 
         self.ramp_samples = int(self.sample_rate * 0.01)
+        self._ramp_curve = np.linspace(0.0, 1.0, self.ramp_samples, dtype=np.float32)
         self.ramping = False
         self.ramp_pos = 0
         self.ramp_direction = 1
+        # While playing, only the render worker touches the ramp state above;
+        # stop_playback posts _stop_requested and the worker starts the fade
+        # before its next chunk.  stop_playback then blocks on the other two
+        # instead of polling: the worker sets _ramp_done once the fade-out is
+        # rendered, the callback sets _fade_played once it has played ring
+        # slot _fade_end - 1.
+        self._stop_requested = threading.Event()
+        self._ramp_done = threading.Event()
+        self._fade_played = threading.Event()
+        self._fade_end = sys.maxsize
 
         self.stream = None
 
+        # Render-ahead ring: a worker thread keeps the slots filled and the
+        # audio callback only copies the oldest rendered chunk out, so Python
+        # hiccups on the render side are absorbed instead of causing XRuns.
+        self._ring = np.zeros((3, self.chunk_size, 2), dtype=np.float32)
+        self._ring_write_idx = 0
+        self._ring_read_idx = 0
+        self._slot_freed = threading.Event()
+        self._worker = None
+        self._worker_running = False
+
+        # Block oscillator: sample k of a chunk is sin(phase + w*k), expanded as
+        # sin(phase)*cos(w*k) + cos(phase)*sin(w*k).  The cos/sin tables only
+        # change with the frequency, so the render worker does no per-sample
+        # transcendentals – just two multiply-adds per channel.
+        self._dt_chunk = self.chunk_size / self.sample_rate
+        self._k = np.arange(self.chunk_size, dtype=np.float32)
+        self._buf_arg = np.empty(self.chunk_size, dtype=np.float32)
+        # Two banks, so a rebuild never writes the table being played.  The
+        # table and its per-chunk phase increments are published together as
+        # one (table, dph_left, dph_right) tuple, so the render worker always
+        # sees a consistent set.
+        self._table_banks = list(np.empty((2, 4, self.chunk_size), dtype=np.float32))
+        self._osc = (self._table_banks[0], 0.0, 0.0)
+        self.update_oscillators()
+
         self.init_ui()
 
         self.osc_timer = QTimer()
@@ -255,7 +403,12 @@ class BinauralGenerator(QMainWindow):
         self.osc_timer.timeout.connect(self.push_oscilloscope_update)
         self.osc_timer.start()
 
-        self.scope_buffer = np.zeros(self.chunk_size, dtype=np.float32)
+        # Single-producer/single-consumer scope ring: the render worker writes
+        # whole chunks and then publishes the write index; the GUI timer only
+        # reads the most recently completed chunk (freshness over completeness).
+        self._scope_ring = np.zeros(4 * self.chunk_size, dtype=np.float32)
+        self._scope_write_idx = 0
+        self._scope_read_idx = 0
 
     def init_ui(self):
         central = QWidget()
@@ -351,6 +504,14 @@ class BinauralGenerator(QMainWindow):
         main_layout.addWidget(self.osc)
         main_layout.addLayout(bottom)
 
+        # Dial drags emit valueChanged far faster than anyone can read the
+        # labels, so text updates are batched: the first change arms the
+        # timer and the labels show the latest values when it fires.
+        self.label_timer = QTimer(self)
+        self.label_timer.setSingleShot(True)
+        self.label_timer.setInterval(50)
+        self.label_timer.timeout.connect(self.update_freq_labels)
+
         self.setStyleSheet(self.window_style())
 
     def window_style(self):
@@ -374,68 +535,103 @@ class BinauralGenerator(QMainWindow):
 
     def update_carrier(self, value):
         self.carrier_freq = float(value)
-        self.carrier_label.setText(f"{self.carrier_freq:.1f} Hz")
-        self.update_freq_labels()
+        self.update_oscillators()
+        self.schedule_label_update()
 
     def update_beat(self, value):
         self.beat_freq = value / 10.0
-        self.beat_label.setText(f"{self.beat_freq:.2f} Hz")
-        self.update_freq_labels()
+        self.update_oscillators()
+        self.schedule_label_update()
+
+    def update_oscillators(self):
+        """Rebuild the per-chunk rotation tables for the current frequencies."""
+        omega_left = 2 * np.pi * self.carrier_freq
+        omega_right = 2 * np.pi * (self.carrier_freq + self.beat_freq)
+        banks = self._table_banks
+        table = banks[1] if self._osc[0] is banks[0] else banks[0]
+        self._fill_rotation(omega_left / self.sample_rate, table[0], table[1])
+        self._fill_rotation(omega_right / self.sample_rate, table[2], table[3])
+        two_pi = 2 * np.pi
+        self._osc = (table,
+                     omega_left * self._dt_chunk % two_pi,
+                     omega_right * self._dt_chunk % two_pi)
+
+    def _fill_rotation(self, w, cos_out, sin_out):
+        # Contiguous float32 in and out keeps np.sin/np.cos on NumPy's SIMD loops.
+        arg = np.multiply(self._k, np.float32(w), out=self._buf_arg)
+        np.cos(arg, out=cos_out)
+        np.sin(arg, out=sin_out)
+
+    def schedule_label_update(self):
+        if not self.label_timer.isActive():
+            self.label_timer.start()
 
     def update_freq_labels(self):
         leftist = self.carrier_freq
         right = self.carrier_freq + self.beat_freq
+        self.carrier_label.setText(f"{self.carrier_freq:.1f} Hz")
+        self.beat_label.setText(f"{self.beat_freq:.2f} Hz")
         self.left_freq_label.setText(f"Left: {leftist:.2f} Hz")
         self.right_freq_label.setText(f"Right: {right:.2f} Hz")
 
     # ------------------------------------------------------------------ #
-    #   AUDIO GENERATION (unchanged – still returns raw bytes)
+    #   AUDIO GENERATION (renders one chunk into a ring slot)
     # ------------------------------------------------------------------ #
-    def generate_audio_chunk(self):
-        t = (np.arange(self.chunk_size) / self.sample_rate).astype(np.float32)
-        left = np.sin(2 * np.pi * self.carrier_freq * t + self.phase_left)
-        right = np.sin(2 * np.pi * (self.carrier_freq + self.beat_freq) * t + self.phase_right)
-
-        self.phase_left += 2 * np.pi * self.carrier_freq * (self.chunk_size / self.sample_rate)
-        self.phase_right += 2 * np.pi * (self.carrier_freq + self.beat_freq) * (self.chunk_size / self.sample_rate)
-        self.phase_left %= 2 * np.pi
-        self.phase_right %= 2 * np.pi
-
-        stereo = np.column_stack((left, right)).astype(np.float32)
-        stereo *= self.master_gain
-
-        if self.ramping:
-            ramp = np.ones(self.chunk_size, dtype=np.float32)
-            if self.ramp_direction == 1:          # ramp-in
-                n = min(self.ramp_samples - self.ramp_pos, self.chunk_size)
-                if n > 0:
-                    ramp[:n] = np.linspace(self.ramp_pos / self.ramp_samples, 1.0, n)
-                    self.ramp_pos += n
-                if self.ramp_pos >= self.ramp_samples:
-                    self.ramping = False
-            else:                                 # ramp-out
-                n = min(self.ramp_samples - self.ramp_pos, self.chunk_size)
-                if n > 0:
-                    ramp[-n:] = np.linspace(1.0 - self.ramp_pos / self.ramp_samples, 0.0, n)
-                    self.ramp_pos += n
-                if self.ramp_pos >= self.ramp_samples:
-                    self.ramping = False
-                    self.playing = False
-            stereo *= ramp.reshape(-1, 1)
-
-        mono = stereo.mean(axis=1)
-        self.scope_buffer = mono.copy()
-        return stereo.tobytes()
+    def generate_audio_chunk(self, outdata):
+        if self._stop_requested.is_set():
+            self._stop_requested.clear()
+            self.ramp_direction = -1
+            self.ramp_pos = 0
+            self.ramping = True
+
+        w = self._scope_write_idx
+        start = w % len(self._scope_ring)
+        mono = self._scope_ring[start:start + self.chunk_size]
+
+        table, dph_left, dph_right = self._osc
+        self.phase_left, self.phase_right, self.ramp_pos = _render(
+            outdata, mono, table, self.phase_left, self.phase_right, dph_left, dph_right,
+            self.master_gain, self._ramp_curve, self.ramp_direction, self.ramp_pos)
+        self._scope_write_idx = w + self.chunk_size
+
+        if self.ramping and self.ramp_pos >= self.ramp_samples:
+            self.ramping = False
+            if self.ramp_direction == -1:
+                self.playing = False
+                self._ramp_done.set()
+
+    # ------------------------------------------------------------------ #
+    #   RENDER WORKER (keeps the ring ahead of the callback)
+    # ------------------------------------------------------------------ #
+    def _render_next_slot(self):
+        w = self._ring_write_idx
+        self.generate_audio_chunk(self._ring[w % len(self._ring)])
+        self._ring_write_idx = w + 1
+
+    def _render_worker(self):
+        slots = len(self._ring)
+        while self._worker_running:
+            if self._ring_write_idx - self._ring_read_idx < slots:
+                self._render_next_slot()
+            else:
+                self._slot_freed.wait(self._dt_chunk)
+                self._slot_freed.clear()
 
     # ------------------------------------------------------------------ #
-    #   sounddevice CALLBACK (receives a numpy array to fill)
+    #   sounddevice CALLBACK (copies the oldest rendered slot out)
     # ------------------------------------------------------------------ #
     def _sd_callback(self, outdata, frames, time, status):
         if status:
             print(status, file=sys.stderr)
-        chunk = self.generate_audio_chunk()
-        audio = np.frombuffer(chunk, dtype=np.float32).reshape(-1, 2)
-        outdata[:] = audio
+        r = self._ring_read_idx
+        if r < self._ring_write_idx:
+            outdata[:] = self._ring[r % len(self._ring)]
+            self._ring_read_idx = r + 1
+            self._slot_freed.set()
+            if r + 1 >= self._fade_end:
+                self._fade_played.set()
+        else:
+            outdata.fill(0)     # renderer fell behind: silence, not stale audio
 
     # ------------------------------------------------------------------ #
     #   PLAY / STOP
@@ -446,37 +642,67 @@ class BinauralGenerator(QMainWindow):
         self.ramping = True
         self.ramp_direction = 1
         self.ramp_pos = 0
-
-        self.stream = sd.OutputStream(
-            samplerate=self.sample_rate,
-            channels=2,
-            blocksize=self.chunk_size,
-            callback=self._sd_callback,
-            dtype='float32'
-        )
-        self.stream.start()
+        self._stop_requested.clear()
+        self._fade_end = sys.maxsize
+
+        # Prefill the ring here, which also compiles (or loads from cache)
+        # the kernel before the stream starts
+        self._ring_write_idx = 0
+        self._ring_read_idx = 0
+        for _ in range(len(self._ring)):
+            self._render_next_slot()
+        self._worker_running = True
+        self._worker = threading.Thread(target=self._render_worker, daemon=True)
+        self._worker.start()
+
+        stream = None
+        try:
+            stream = sd.OutputStream(
+                samplerate=self.sample_rate,
+                channels=2,
+                blocksize=self.chunk_size,
+                callback=self._sd_callback,
+                dtype='float32'
+            )
+            stream.start()
+        except Exception:
+            # no usable device: don't leave the worker spinning behind us
+            if stream is not None:
+                stream.close()
+            self._stop_worker()
+            raise
+        self.stream = stream
         self.playing = True
         self.play_button.setText("Stop")
 
     def stop_playback(self):
         if not (self.stream and self.stream.active):
             return
-        self.ramping = True
-        self.ramp_direction = -1
-        self.ramp_pos = 0
+        self._ramp_done.clear()
+        self._fade_played.clear()
+        self._stop_requested.set()
 
-        # wait for ramp-down
-        while self.ramping:
-            sd.sleep(10)
+        # wait for ramp-down to be rendered, then for the callback to play it;
+        # the timeouts keep a stalled stream from freezing the GUI
+        self._ramp_done.wait(timeout=0.5)
+        self._fade_end = self._ring_write_idx + 1   # +1: fade slot may be unpublished
+        self._fade_played.wait(timeout=0.5)
 
         self.stream.stop()
         self.stream.close()
         self.stream = None
+        self._stop_worker()
         self.playing = False
         self.play_button.setText("Start")
         self.phase_left = 0.0
         self.phase_right = 0.0
 
+    def _stop_worker(self):
+        self._worker_running = False
+        self._slot_freed.set()
+        self._worker.join()
+        self._worker = None
+
     def toggle_playback(self):
         if not self.playing:
             self.start_playback()
@@ -487,11 +713,25 @@ class BinauralGenerator(QMainWindow):
     #   OSCILLOSCOPE UPDATE
     # ------------------------------------------------------------------ #
     def push_oscilloscope_update(self):
+        w = self._scope_write_idx
+        if w == self._scope_read_idx:
+            return
+        self._scope_read_idx = w
+        start = (w - self.chunk_size) % len(self._scope_ring)
         try:
-            self.osc.update_buffer(self.scope_buffer)
+            self.osc.update_buffer(self._scope_ring[start:start + self.chunk_size])
         except Exception:
             pass
 
+    def showEvent(self, event):
+        self.osc_timer.start()
+        super().showEvent(event)
+
+    def hideEvent(self, event):
+        # Minimised or hidden: nothing to draw, so stop polling the scope ring
+        self.osc_timer.stop()
+        super().hideEvent(event)
+
     # ------------------------------------------------------------------ #
     #   CLEANUP
     # ------------------------------------------------------------------ #